@@ -10,6 +10,8 @@ from contextlib import asynccontextmanager
 async def lifespan(app: FastAPI):
     setup_logging(logging.DEBUG)
     yield
+    # Release the shared FRED client's HTTP session and the service's database session
+    macro_service.close()
 
 # Initialize FastAPI app
 app = FastAPI(
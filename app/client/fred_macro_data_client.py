@@ -1,27 +1,187 @@
 import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from threading import BoundedSemaphore, Lock
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-from fredapi import Fred
+from cachetools import TTLCache, cached
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 
+from config.cache_config import FRED_HTTP_CACHE_PATH
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Read the .env file once per process rather than on every client construction
+load_dotenv()
+
+FRED_API_KEY = os.getenv('FRED_API_KEY')
+
+FRED_OBSERVATIONS_URL = "https://api.stlouisfed.org/fred/series/observations"
+
+# Seconds to wait for FRED to respond before giving up on a request
+FRED_REQUEST_TIMEOUT = 10
+
+# Upper bound on concurrent FRED requests issued by a single multi-series call
+FRED_MAX_WORKERS = 4
+
+# Keep-alive connections pooled for the FRED host. Several multi-series calls can run at
+# once (fetch_all overlaps indicator groups), so in-flight requests across all of them
+# are capped at the pool size instead of opening and discarding extra connections
+FRED_POOL_MAXSIZE = 10
+FRED_REQUEST_SLOTS = BoundedSemaphore(FRED_POOL_MAXSIZE)
+
+# On-disk HTTP cache (at FRED_HTTP_CACHE_PATH) shared across processes and scheduler
+# runs. Daily series are refreshed hourly, monthly releases once a day, everything
+# else every six hours
+FRED_HTTP_CACHE_DEFAULT_EXPIRY = timedelta(hours=6)
+FRED_HTTP_CACHE_EXPIRY = {
+    'DGS3MO': timedelta(hours=1),
+    'DGS2': timedelta(hours=1),
+    'DGS10': timedelta(hours=1),
+    'TOTALSL': timedelta(days=1),
+    'UMCSENT': timedelta(days=1),
+    'DSPIC96': timedelta(days=1),
+    'USALOLITOAASTSAM': timedelta(days=1),
+    'BBKMLEIX': timedelta(days=1)
+}
+
+# Observations fetched within the last hour are served from memory, so overlapping
+# requests for the same series and window only hit FRED once
+FRED_SERIES_CACHE = TTLCache(maxsize=256, ttl=3600)
+FRED_SERIES_CACHE_LOCK = Lock()
+
+# FRED allows 120 requests per minute per API key
+FRED_RATE_LIMIT_CALLS = 120
+FRED_RATE_LIMIT_PERIOD = 60
+
+
+class _RateLimiter:
+    """Thread-safe sliding-window limiter allowing max_calls within every period seconds."""
+
+    def __init__(self, max_calls: int, period: float):
+        self._max_calls = max_calls
+        self._period = period
+        self._calls = deque()
+        self._lock = Lock()
+
+    def acquire(self):
+        """Block until another call fits in the window, then record it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self._period:
+                    self._calls.popleft()
+                if len(self._calls) < self._max_calls:
+                    self._calls.append(now)
+                    return
+                wait = self._period - (now - self._calls[0])
+            time.sleep(wait)
+
+
+# Shared by every client and worker thread, since the limit applies per API key
+FRED_RATE_LIMITER = _RateLimiter(FRED_RATE_LIMIT_CALLS, FRED_RATE_LIMIT_PERIOD)
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a rate limiter slot before every request it sends over the network."""
+
+    def __init__(self, rate_limiter: _RateLimiter, **kwargs):
+        self._rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        # CachedSession answers cache hits without reaching the adapter, so only
+        # real network round-trips count against the limit
+        self._rate_limiter.acquire()
+        return super().send(request, **kwargs)
+
+
 class FredMacroDataClient:
     """Service for fetching macroeconomic data from FRED."""
     
-    def __init__(self):
-        """Initialize the FredMacroDataClient with FRED API credentials."""
-        load_dotenv()
-        self.fred_api_key = os.getenv('FRED_API_KEY')
+    def __init__(self, api_key: Optional[str] = None):
+        """
+        Initialize the FredMacroDataClient with FRED API credentials.
+
+        Args:
+            api_key (Optional[str]): FRED API key (default: FRED_API_KEY from the environment).
+        """
+        self.fred_api_key = api_key or FRED_API_KEY
         if not self.fred_api_key:
             raise ValueError("FRED API key not found. Please set FRED_API_KEY in .env file")
-        self.fred = Fred(api_key=self.fred_api_key)
+        # Reuse keep-alive connections to the FRED API across series requests and keep
+        # responses on disk so repeated runs skip the network for unchanged series
+        self._http = CachedSession(
+            FRED_HTTP_CACHE_PATH,
+            backend="sqlite",
+            expire_after=FRED_HTTP_CACHE_DEFAULT_EXPIRY,
+            allowable_methods=["GET"],
+            ignored_parameters=["api_key"]
+        )
+        self._http.headers.update({"Accept": "application/json"})
+        self._http.mount("https://", _RateLimitedAdapter(
+            FRED_RATE_LIMITER,
+            pool_connections=4,
+            pool_maxsize=FRED_POOL_MAXSIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        ))
         logger.info("FredMacroDataClient initialized with FRED API key")
 
+    def close(self):
+        """Close the underlying HTTP session."""
+        self._http.close()
+
+    @cached(
+        FRED_SERIES_CACHE,
+        key=lambda self, series_id, start_date, end_date: (series_id, start_date.date(), end_date.date()),
+        lock=FRED_SERIES_CACHE_LOCK
+    )
+    def _fetch_fred_observations(
+        self,
+        series_id: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict[str, str]]:
+        """
+        Helper method to fetch the raw observations of a single series from the FRED API.
+
+        Args:
+            series_id (str): The ID of the FRED series to fetch.
+            start_date (datetime): The start date for the observation period.
+            end_date (datetime): The end date for the observation period.
+
+        Returns:
+            List[Dict[str, str]]: Observations in ascending date order, each with a 'date'
+                                  and a 'value' string ('.' marks a missing value).
+
+        Raises:
+            requests.RequestException: If the HTTP request fails.
+        """
+        params = {
+            "series_id": series_id,
+            "api_key": self.fred_api_key,
+            "file_type": "json",
+            "observation_start": start_date.date().isoformat(),
+            "observation_end": end_date.date().isoformat()
+        }
+        with FRED_REQUEST_SLOTS:
+            response = self._http.get(
+                FRED_OBSERVATIONS_URL,
+                params=params,
+                timeout=FRED_REQUEST_TIMEOUT,
+                expire_after=FRED_HTTP_CACHE_EXPIRY.get(series_id, FRED_HTTP_CACHE_DEFAULT_EXPIRY)
+            )
+        response.raise_for_status()
+        return response.json()["observations"]
 
     def _fetch_fred_series(
         self,
@@ -46,13 +206,16 @@ class FredMacroDataClient:
         try:
             logger.info(
                 "Fetching FRED series: %s with parameters: start_date=%s, end_date=%s",
-                series_id, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
+                series_id, start_date.date(), end_date.date()
             )
-            data = self.fred.get_series(
-                series_id,
-                observation_start=start_date,
-                observation_end=end_date
+            observations = self._fetch_fred_observations(series_id, start_date, end_date)
+            # Parse straight into NumPy arrays; FRED marks missing values with '.'
+            dates = np.array([obs["date"] for obs in observations], dtype="datetime64[D]")
+            values = np.array(
+                [np.nan if obs["value"] == "." else float(obs["value"]) for obs in observations],
+                dtype=np.float64
             )
+            data = pd.Series(values, index=pd.DatetimeIndex(dates))
             logger.info("Successfully fetched %d observations for series %s", len(data), series_id)
             if data.empty:
                 logger.warning("No data returned for series %s within the specified date range.", series_id)
@@ -94,6 +257,33 @@ class FredMacroDataClient:
             logger.error("Error processing values for series %s: %s", series_id, str(e))
             return None # Return None on error
 
+    def _get_fred_series_values(
+        self,
+        series_ids: List[str],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[str, Optional[pd.Series]]:
+        """
+        Fetches several FRED series concurrently and returns their non-null values.
+
+        The requests are network-bound, so running them on a small thread pool
+        overlaps the round-trips instead of paying for them one after another.
+
+        Args:
+            series_ids (List[str]): The IDs of the FRED series to fetch.
+            start_date (datetime): The start date for the observation period.
+            end_date (datetime): The end date for the observation period.
+
+        Returns:
+            Dict[str, Optional[pd.Series]]: The result of _get_fred_series_value keyed by series ID.
+        """
+        with ThreadPoolExecutor(max_workers=min(len(series_ids), FRED_MAX_WORKERS)) as executor:
+            results = executor.map(
+                lambda series_id: self._get_fred_series_value(series_id, start_date, end_date),
+                series_ids
+            )
+            return dict(zip(series_ids, results, strict=True))
+
     def get_leading_indicators(self, start_date: datetime, end_date: datetime) -> Dict[str, Optional[pd.Series]]:
         """
         Fetch all values for the US Leading Index (USALOLITOAASTSAM)
@@ -116,8 +306,9 @@ class FredMacroDataClient:
         fetch_errors: List[str] = []
 
         logger.info("Fetching leading indicator values...")
+        fetched = self._get_fred_series_values(list(series_map.values()), start_date, end_date)
         for key, series_id in series_map.items():
-            value = self._get_fred_series_value(series_id, start_date, end_date)
+            value = fetched[series_id]
             if value is not None:
                 values[key] = value if not value.empty else None
             else:
@@ -148,9 +339,9 @@ class FredMacroDataClient:
         series_data = {}
         fetch_errors = []
 
+        fetched = self._get_fred_series_values(series_ids, start_date, end_date)
         for series_id in series_ids:
-            # Use the dedicated helper for fetching all values
-            value = self._get_fred_series_value(series_id, start_date, end_date)
+            value = fetched[series_id]
             if value is not None:
                 key = series_id.lower()
                 series_data[key] = value if not value.empty else None
@@ -188,7 +379,7 @@ class FredMacroDataClient:
         }
 
         logger.info("Retrieved Treasury yields and calculated spreads for period %s to %s", 
-                   start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+                   start_date.date(), end_date.date())
         return result
 
     def get_consumer_indices(self, start_date: datetime, end_date: datetime) -> Dict[str, Optional[pd.Series]]:
@@ -216,8 +407,9 @@ class FredMacroDataClient:
         fetch_errors: List[str] = []
 
         logger.info("Fetching consumer indicator values...")
+        fetched = self._get_fred_series_values(list(series_map.values()), start_date, end_date)
         for key, series_id in series_map.items():
-            value = self._get_fred_series_value(series_id, start_date, end_date)
+            value = fetched[series_id]
             if value is not None:
                 values[key] = value if not value.empty else None
             else:
@@ -253,8 +445,9 @@ class FredMacroDataClient:
         fetch_errors: List[str] = []
 
         logger.info("Fetching financial condition indicator values...")
+        fetched = self._get_fred_series_values(list(series_map.values()), start_date, end_date)
         for key, series_id in series_map.items():
-            value = self._get_fred_series_value(series_id, start_date, end_date)
+            value = fetched[series_id]
             if value is not None:
                 values[key] = value if not value.empty else None
             else:
@@ -266,3 +459,17 @@ class FredMacroDataClient:
 
         logger.info("Fetched financial condition indices with %d series", len(values))
         return values
+
+
+@lru_cache(maxsize=1)
+def get_fred_client() -> FredMacroDataClient:
+    """
+    Return the process-wide FredMacroDataClient, creating it on first use.
+
+    Sharing one client keeps a single pooled HTTP session and on-disk cache
+    instead of rebuilding them for every service instance.
+
+    Returns:
+        FredMacroDataClient: The shared client instance.
+    """
+    return FredMacroDataClient()
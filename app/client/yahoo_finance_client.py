@@ -1,15 +1,24 @@
 import os
 from datetime import datetime, timedelta
+from functools import lru_cache
+from threading import Lock
 from typing import Dict, Optional
 
-import yfinance as yf
 import pandas as pd
+from cachetools import TTLCache, cached
 from dotenv import load_dotenv
 
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Commodity prices fetched within the last minute are served from memory, so a dashboard
+# polling the same date range does not hit Yahoo Finance on every refresh. This is the
+# only cache on the Yahoo path: yfinance manages its own curl_cffi session, so no
+# requests-based HTTP cache can be plugged in underneath it
+YAHOO_PRICE_CACHE = TTLCache(maxsize=64, ttl=60)
+YAHOO_PRICE_CACHE_LOCK = Lock()
+
 class YahooFinanceClient:
     """Service for fetching commodity price data from Yahoo Finance."""
     
@@ -18,88 +27,18 @@ class YahooFinanceClient:
         'crude_oil': 'CL=F',  # Crude Oil Futures
         'gold': 'GC=F',       # Gold Futures
     }
+    TICKERS = list(SYMBOLS.values())
     
     def __init__(self):
         """Initialize the YahooFinanceClient."""
         logger.info("YahooFinanceClient initialized")
 
-    def _fetch_commodity_data(
-        self,
-        symbol: str,
-        start_date: datetime,
-        end_date: datetime
-    ) -> pd.DataFrame:
-        """
-        Helper method to fetch commodity data from Yahoo Finance.
-
-        Args:
-            symbol (str): The Yahoo Finance symbol to fetch.
-            start_date (datetime): The start date for the observation period.
-            end_date (datetime): The end date for the observation period.
-
-        Returns:
-            pd.DataFrame: The fetched data as a DataFrame.
-
-        Raises:
-            Exception: If there is an error fetching data from Yahoo Finance.
-        """
-        try:
-            logger.info(
-                "Fetching Yahoo Finance data for %s with parameters: start_date=%s, end_date=%s",
-                symbol, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
-            )
-            
-            ticker = yf.Ticker(symbol)
-            df = ticker.history(
-                start=start_date.strftime('%Y-%m-%d'),
-                end=end_date.strftime('%Y-%m-%d')
-            )
-            
-            if df.empty:
-                logger.warning("No data returned for %s within the specified date range.", symbol)
-                return pd.DataFrame()
-            
-            logger.info("Successfully fetched %d observations for %s", len(df), symbol)
-            return df
-            
-        except Exception as e:
-            logger.error("Error fetching Yahoo Finance data for %s: %s", symbol, str(e))
-            raise Exception(f"Error fetching Yahoo Finance data for {symbol}: {str(e)}")
-
-    def _get_latest_price(
-        self,
-        symbol: str,
-        start_date: datetime,
-        end_date: datetime
-    ) -> Optional[float]:
-        """
-        Fetches commodity data and returns the latest available closing price.
-
-        Args:
-            symbol (str): The Yahoo Finance symbol to fetch.
-            start_date (datetime): The start date for the observation period.
-            end_date (datetime): The end date for the observation period.
-
-        Returns:
-            Optional[float]: The latest closing price, or None if no data is available
-                           or an error occurred.
-        """
-        try:
-            data = self._fetch_commodity_data(symbol, start_date, end_date)
-            if data.empty:
-                return None
-                
-            # Get the last available closing price
-            last_price = data['Close'].iloc[-1] if not data.empty else None
-            result = float(last_price) if last_price is not None else None
-            
-            logger.info("Successfully processed latest price for %s: %s", symbol, result)
-            return result
-                
-        except Exception as e:
-            logger.error("Error processing latest price for %s: %s", symbol, str(e))
-            return None
-
+    # Only successful results are cached; a download that raises is retried on the next call
+    @cached(
+        YAHOO_PRICE_CACHE,
+        key=lambda self, start_date, end_date: (start_date.date(), end_date.date()),
+        lock=YAHOO_PRICE_CACHE_LOCK
+    )
     def get_commodity_prices(self, start_date: datetime, end_date: datetime) -> Dict[str, Optional[float]]:
         """
         Fetch the latest prices for crude oil and gold from Yahoo Finance.
@@ -111,20 +50,61 @@ class YahooFinanceClient:
         Returns:
             Dict[str, Optional[float]]: A dictionary containing the latest available prices
                                       for crude oil and gold.
-                                      Returns None for a value if data is unavailable or an error occurs.
+                                      Returns None for a value if data is unavailable for that commodity.
+
+        Raises:
+            Exception: If the download fails or no price is available for any commodity.
         """
         latest_prices: Dict[str, Optional[float]] = {}
         fetch_errors: list[str] = []
 
         logger.info("Fetching latest commodity prices...")
+        # Download every symbol in one call; yfinance returns a frame with one Close
+        # column per symbol instead of a separate history frame per Ticker
+        try:
+            import yfinance as yf
+
+            data = yf.download(
+                self.TICKERS,
+                start=start_date.date(),
+                end=end_date.date(),
+                auto_adjust=True,
+                progress=False,
+                threads=True
+            )
+        except Exception as e:
+            logger.error("Error downloading Yahoo Finance data for %s: %s", ", ".join(self.TICKERS), str(e))
+            raise Exception(f"Error downloading Yahoo Finance data for {', '.join(self.TICKERS)}: {str(e)}") from e
+        closes = data['Close'] if not data.empty else pd.DataFrame()
+
         for commodity, symbol in self.SYMBOLS.items():
-            price = self._get_latest_price(symbol, start_date, end_date)
+            price = None
+            if symbol in closes:
+                last_index = closes[symbol].last_valid_index()
+                if last_index is not None:
+                    price = float(closes[symbol].at[last_index])
             latest_prices[commodity] = price
             if price is None:
                 fetch_errors.append(commodity)
 
+        if len(fetch_errors) == len(self.SYMBOLS):
+            # yfinance reports per-ticker failures as empty columns instead of raising, so
+            # a failure that hit every ticker has to be surfaced here
+            logger.error("No latest data available for any commodity: %s", ", ".join(fetch_errors))
+            raise Exception(f"Error fetching Yahoo Finance data: no prices returned for {', '.join(self.TICKERS)}")
         if fetch_errors:
             logger.warning("Failed to fetch/process latest data for commodities: %s", ", ".join(fetch_errors))
 
         logger.info("Fetched latest commodity prices: %s", latest_prices)
         return latest_prices 
+
+
+@lru_cache(maxsize=1)
+def get_yahoo_finance_client() -> YahooFinanceClient:
+    """
+    Return the process-wide YahooFinanceClient, creating it on first use.
+
+    Returns:
+        YahooFinanceClient: The shared client instance.
+    """
+    return YahooFinanceClient()
@@ -0,0 +1,12 @@
+import os
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Project root, so the default cache location does not depend on the working directory
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# On-disk HTTP cache for FRED responses; requests-cache appends the .sqlite suffix
+FRED_HTTP_CACHE_PATH = os.getenv("FRED_HTTP_CACHE_PATH", str(PROJECT_ROOT / "macro_cache"))
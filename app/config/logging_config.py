@@ -14,6 +14,16 @@ def setup_logging(
         level: The logging level (default: logging.INFO)
         log_format: Custom log format string (optional)
     """
+    # Prevent propagation of logs from third-party libraries
+    for logger_name in ['urllib3', 'requests']:
+        logging.getLogger(logger_name).propagate = False
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    if root_logger.hasHandlers():
+        # Already configured; keep the existing handler instead of stacking another one
+        return
+
     if log_format is None:
         log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
@@ -24,10 +34,6 @@ def setup_logging(
         stream=sys.stdout
     )
 
-    # Prevent propagation of logs from third-party libraries
-    for logger_name in ['urllib3', 'requests']:
-        logging.getLogger(logger_name).propagate = False
-
 
 def get_logger(name: str) -> logging.Logger:
     """
@@ -39,7 +39,7 @@ async def get_us_economic_indicators(
     """
     try:
         logger.info("Fetching US economic indicators from %s to %s", 
-                   start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+                   start_date.date(), end_date.date())
         service = MacroDataService()
         indicators = service.get_all_us_indicators(start_date, end_date)
         
@@ -76,7 +76,7 @@ async def get_china_economic_indicators(
     """
     try:
         logger.info("Fetching China economic indicators from %s to %s", 
-                   start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+                   start_date.date(), end_date.date())
         service = MacroDataService()
         indicators = service.get_all_china_indicators(start_date, end_date)
         
@@ -109,24 +109,19 @@ async def fetch_and_store_all_macro_indices(
     """
     try:
         logger.info("Fetching all indices from %s to %s", 
-                   date_range.start_date.strftime('%Y-%m-%d'), 
-                   date_range.end_date.strftime('%Y-%m-%d'))
+                   date_range.start_date.date(),
+                   date_range.end_date.date())
         service = MacroDataService()
         
-        # Fetch and store all different types of indices
-        results = {
-            # "leading_indicators": service.fetch_and_store_leading_indicators_by_date_range(date_range.start_date, date_range.end_date),
-            # "consumer_indices": service.fetch_and_store_consumer_indices_by_date_range(date_range.start_date, date_range.end_date),
-            # "financial_condition_indices": service.fetch_and_store_financial_condition_indices_by_date_range(date_range.start_date, date_range.end_date),
-            # "treasury_data": service.fetch_and_store_treasury_data_by_date_range(date_range.start_date, date_range.end_date),
-            # # "pmi_indicators": service.fetch_and_store_pmi_indicators_by_date_range(date_range.start_date, date_range.end_date),
-            # "commodity_prices": service.fetch_and_store_commodity_prices_by_date_range(date_range.start_date, date_range.end_date),
-            "china_gdp_data": service.fetch_and_store_china_gdp_growth_by_date_range(date_range.start_date, date_range.end_date)
-        }
+        # Every indicator group is fetched concurrently; a failed group is reported
+        # alongside the others instead of aborting the whole request
+        outcomes = await service.fetch_all(date_range.start_date, date_range.end_date)
+        errors = {name: str(outcome) for name, outcome in outcomes.items() if isinstance(outcome, Exception)}
         
         response = {
-            "status": "success",
-            "results": results
+            "status": "partial_success" if errors else "success",
+            "results": {name: name not in errors for name in outcomes},
+            "errors": errors
         }
         logger.info("Successfully completed fetching and storing all indices")
         return response
@@ -1,15 +1,25 @@
 import pymysql
+from contextlib import contextmanager
+from typing import Iterator
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.orm import Session, sessionmaker, scoped_session
 from sqlalchemy.ext.declarative import declarative_base
-from config.db_config import DATABASE_URL
+from config.db_config import DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE
 from repository.model.macro_indicator import Base
 
 # Register PyMySQL with SQLAlchemy
 pymysql.install_as_MySQLdb()
 
-# Create SQLAlchemy engine
-engine = create_engine(DATABASE_URL)
+# Create SQLAlchemy engine with a shared connection pool; pre-ping and recycle
+# keep pooled connections usable across MySQL idle disconnects
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE,
+    echo=False
+)
 
 # Create session factory
 session_factory = sessionmaker(bind=engine)
@@ -21,10 +31,20 @@ def init_db():
     Base.metadata.create_all(bind=engine)
 
 # Function to get a database session
-def get_db_session():
-    """Get a new database session."""
-    db = SessionLocal()
+@contextmanager
+def get_db_session() -> Iterator[Session]:
+    """
+    Provide a database session for the duration of a with block.
+    
+    The session is committed when the block exits normally, rolled back if it
+    raises, and always closed so its connection returns to the pool.
+    """
+    db = session_factory()
     try:
-        return db
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
@@ -1,10 +1,31 @@
-from datetime import datetime, date
+from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional, Dict
 from sqlalchemy.orm import Session
 from sqlalchemy import func
+from sqlalchemy.dialects.mysql import insert
 
 from repository.model.macro_indicator import MacroIndicator
-from repository.database_base import get_db_session
+from repository.database_base import SessionLocal
+
+
+@lru_cache(maxsize=1)
+def _upsert_statement():
+    """
+    Build the INSERT ... ON DUPLICATE KEY UPDATE statement once per process.
+    
+    The statement carries no values; rows are bound at execution time, so the same
+    object (and its cached compiled form) is reused by every bulk upsert.
+    """
+    stmt = insert(MacroIndicator)
+    return stmt.on_duplicate_key_update(
+        name=stmt.inserted.name,
+        value=stmt.inserted.value,
+        is_leading_indicator=stmt.inserted.is_leading_indicator,
+        region=stmt.inserted.region,
+        creation_data_time=stmt.inserted.creation_data_time
+    )
+
 
 class MacroIndicatorRepository:
     """
@@ -12,7 +33,9 @@ class MacroIndicatorRepository:
     """
     
     def __init__(self, session: Optional[Session] = None):
-        self.session = session or get_db_session()
+        # Default to the scoped session registry so every thread that uses the
+        # repository transparently works on its own thread-local session.
+        self.session = session or SessionLocal
     
     def create(self, 
                type: str, 
@@ -51,46 +74,30 @@ class MacroIndicatorRepository:
         
         return indicator
     
-    def find_by_type_and_date(self, indicator_type: str, date_time: date) -> Optional[MacroIndicator]:
+    def bulk_upsert(self, rows: List[Dict]) -> int:
         """
-        Find a macro indicator by its type and date.
+        Insert or update many macro indicator records with a single statement.
         
-        Args:
-            indicator_type: The type of the indicator.
-            date_time: The date of the indicator value (datetime.date object).
-            
-        Returns:
-            The MacroIndicator instance or None if not found.
-        """
-        # Ensure date comparison is done only on the date part if date_time is datetime
-        start_of_day = datetime.combine(date_time, datetime.min.time())
-        end_of_day = datetime.combine(date_time, datetime.max.time())
-
-        return self.session.query(MacroIndicator)\
-            .filter(MacroIndicator.type == indicator_type)\
-            .filter(MacroIndicator.date_time >= start_of_day)\
-            .filter(MacroIndicator.date_time <= end_of_day)\
-            .first()
-    
-    def delete(self, indicator: MacroIndicator) -> bool:
-        """
-        Delete a specific macro indicator record.
+        Rows are matched on the (type, date_time) unique key; when a record already
+        exists its value and metadata are replaced instead of inserting a duplicate.
         
         Args:
-            indicator: The MacroIndicator instance to delete.
+            rows: List of dictionaries with the MacroIndicator column values
             
         Returns:
-            True if deleted successfully, raises exception otherwise.
+            int: Number of rows written
         """
+        # Nothing to write: return before the session checks out a pooled connection
+        if not rows:
+            return 0
+
         try:
-            self.session.delete(indicator)
+            self.session.execute(_upsert_statement(), rows)
             self.session.commit()
-            return True
-        except Exception as e:
+            return len(rows)
+        except Exception:
             self.session.rollback()
-            # Optionally log the error here
-            print(f"Error deleting indicator: {e}") # Replace with logger if available
-            raise # Re-raise the exception to signal failure
+            raise
     
     def find_by_region_date_range(
         self,
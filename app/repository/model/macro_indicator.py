@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Index, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 
@@ -9,12 +9,16 @@ class MacroIndicator(Base):
     SQLAlchemy model for the macro_indicator table.
     """
     __tablename__ = 'macro_indicator'
+    __table_args__ = (
+        UniqueConstraint('type', 'date_time', name='uq_macro_indicator_type_date_time'),
+        Index('ix_macro_indicator_region_date_time', 'region', 'date_time'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    type = Column(String(100), nullable=False)
+    type = Column(String(64), nullable=False)
     name = Column(String(100), nullable=False)
     value = Column(Float, nullable=False)
     date_time = Column(DateTime, nullable=False)
     is_leading_indicator = Column(Boolean, default=False)
-    region = Column(String(50), nullable=False, default="US")
+    region = Column(String(16), nullable=False, default="US")
     creation_data_time = Column(DateTime, default=datetime.utcnow) 
\ No newline at end of file
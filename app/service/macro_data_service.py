@@ -1,24 +1,208 @@
+import asyncio
+from contextlib import contextmanager
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, Optional
-from client.fred_macro_data_client import FredMacroDataClient
-from client.yahoo_finance_client import YahooFinanceClient
+from typing import Callable, Dict, Final, Iterator, List, Optional, Tuple, Union
+from client.fred_macro_data_client import FredMacroDataClient, get_fred_client
+from client.yahoo_finance_client import YahooFinanceClient, get_yahoo_finance_client
+from repository.database_base import get_db_session
 from repository.macro_indicator_repo import MacroIndicatorRepository
 from config.logging_config import get_logger
 from client.akshare_finance_client import AkshareFinanceClient
 
 logger = get_logger(__name__)
 
+# Upper bound on indicator groups fetched at once by fetch_all. Each FRED group fans out
+# over its own small thread pool; the FRED client caps the combined in-flight requests
+# at its connection pool size (FRED_POOL_MAXSIZE)
+FETCH_ALL_MAX_CONCURRENCY = 3
+
+
+def _start_of_day(date_time: datetime) -> datetime:
+    """Truncate a datetime to midnight so point-in-time values share one (type, date_time) key per day."""
+    return datetime.combine(date_time.date(), datetime.min.time())
+
+
+def _series_rows(
+    series: Optional[pd.Series],
+    indicator_type: str,
+    indicator_name: str,
+    is_leading_indicator: bool = False,
+    region: str = "US"
+) -> List[Dict]:
+    """
+    Convert the non-null values of a date-indexed series into database rows.
+    
+    NaN values are dropped and the values converted to floats in one vectorised pass
+    instead of checking and boxing each cell in a Python loop.
+    
+    Args:
+        series (Optional[pd.Series]): Values indexed by date, or None if unavailable
+        indicator_type (str): Indicator type stored in the database
+        indicator_name (str): Indicator name stored in the database
+        is_leading_indicator (bool): Whether the series is a leading indicator
+        region (str): Region stored in the database
+        
+    Returns:
+        List[Dict]: Rows ready to be passed to MacroIndicatorRepository.bulk_upsert
+    """
+    if series is None:
+        return []
+    series = series.dropna()
+    # Columns shared by every row of the series are built once and copied per row
+    base_row = {
+        "type": indicator_type,
+        "name": indicator_name,
+        "is_leading_indicator": is_leading_indicator,
+        "region": region
+    }
+    return [
+        {**base_row, "value": value, "date_time": date}
+        for date, value in zip(series.index.tolist(), series.to_numpy(dtype=float).tolist(), strict=True)
+    ]
+
+
+def _series_group_rows(
+    data: Dict[str, Optional[pd.Series]],
+    indicator_map: Dict[str, Tuple[str, str]],
+    is_leading_indicator: bool = False,
+    region: str = "US"
+) -> List[Dict]:
+    """
+    Convert a group of date-indexed series returned by a client into database rows.
+    
+    Args:
+        data (Dict[str, Optional[pd.Series]]): Series keyed by the client's data key
+        indicator_map (Dict[str, Tuple[str, str]]): Data key to (indicator type, indicator name)
+        is_leading_indicator (bool): Whether the series are leading indicators
+        region (str): Region stored in the database
+        
+    Returns:
+        List[Dict]: Rows ready to be passed to MacroIndicatorRepository.bulk_upsert
+    """
+    rows = []
+    for data_key, (indicator_type, indicator_name) in indicator_map.items():
+        rows.extend(_series_rows(data.get(data_key), indicator_type, indicator_name, is_leading_indicator, region))
+    return rows
+
+
+def _scalar_rows(
+    data: Dict[str, Optional[float]],
+    indicator_map: Dict[str, Tuple[str, str]],
+    date_time: datetime,
+    is_leading_indicator: bool = False,
+    region: str = "US"
+) -> List[Dict]:
+    """
+    Convert a group of point-in-time values returned by a client into database rows.
+    
+    Args:
+        data (Dict[str, Optional[float]]): Values keyed by the client's data key
+        indicator_map (Dict[str, Tuple[str, str]]): Data key to (indicator type, indicator name)
+        date_time (datetime): Date every value is stored against
+        is_leading_indicator (bool): Whether the values are leading indicators
+        region (str): Region stored in the database
+        
+    Returns:
+        List[Dict]: Rows for every value that is available
+    """
+    return [
+        {
+            "type": indicator_type,
+            "name": indicator_name,
+            "value": float(data[data_key]),
+            "date_time": date_time,
+            "is_leading_indicator": is_leading_indicator,
+            "region": region
+        }
+        for data_key, (indicator_type, indicator_name) in indicator_map.items()
+        if data.get(data_key) is not None
+    ]
+
+
+@contextmanager
+def _log_and_reraise(operation: str) -> Iterator[None]:
+    """Log any exception raised inside the block against the operation name, then propagate it."""
+    try:
+        yield
+    except Exception as e:
+        logger.error("Error in %s: %s", operation, str(e))
+        raise
+
+
+# Map of client data keys to database indicator types and names for each indicator group
+LEADING_INDICATOR_MAP: Final[Dict[str, Tuple[str, str]]] = {
+    'leading_index_us': ('USALOLITOAASTSAM', 'US_LEADING_INDEX'),
+    'leading_index_de': ('BBKMLEIX', 'BBK_LEADING_INDEX')
+}
+
+TREASURY_MAP: Final[Dict[str, Tuple[str, str]]] = {
+    'dgs3mo': ('DGS3MO', 'TREASURY_3M_YIELD'),
+    'dgs2': ('DGS2', 'TREASURY_2Y_YIELD'),
+    'dgs10': ('DGS10', 'TREASURY_10Y_YIELD'),
+    'spread_10y_2y': ('SPREAD_10Y_2Y', 'TREASURY_SPREAD_10Y_2Y'),
+    'spread_10y_3m': ('SPREAD_10Y_3M', 'TREASURY_SPREAD_10Y_3M')
+}
+
+CONSUMER_MAP: Final[Dict[str, Tuple[str, str]]] = {
+    'consumer_credit': ('TOTALSL', 'CONSUMER_CREDIT'),
+    'consumer_sentiment': ('UMCSENT', 'CONSUMER_SENTIMENT'),
+    'disposable_income': ('DSPIC96', 'DISPOSABLE_INCOME')
+}
+
+FINANCIAL_CONDITION_MAP: Final[Dict[str, Tuple[str, str]]] = {
+    'national_financial_conditions': ('NFCI', 'NATIONAL_FINANCIAL_CONDITIONS'),
+    'adjusted_financial_conditions': ('ANFCI', 'ADJUSTED_FINANCIAL_CONDITIONS')
+}
+
+COMMODITY_MAP: Final[Dict[str, Tuple[str, str]]] = {
+    'crude_oil': ('CRUDE_OIL_FUT', 'CRUDE_OIL_FUTURES'),
+    'gold': ('GOLD_FUT', 'GOLD_FUTURES')
+}
+
+CHINA_GDP_MAP: Final[Dict[str, Tuple[str, str]]] = {
+    'GDP': ('GDP', 'CHINA_GDP'),
+    'GDP_YOY': ('GDP_YOY', 'CHINA_GDP_YOY'),
+    'FIRST_INDUSTRY_GDP': ('FIRST_INDUSTRY_GDP', 'CHINA_FIRST_INDUSTRY_GDP'),
+    'FIRST_INDUSTRY_GDP_YOY': ('FIRST_INDUSTRY_GDP_YOY', 'CHINA_FIRST_INDUSTRY_GDP_YOY'),
+    'SECOND_INDUSTRY_GDP': ('SECOND_INDUSTRY_GDP', 'CHINA_SECOND_INDUSTRY_GDP'),
+    'SECOND_INDUSTRY_GDP_YOY': ('SECOND_INDUSTRY_GDP_YOY', 'CHINA_SECOND_INDUSTRY_GDP_YOY'),
+    'THIRD_INDUSTRY_GDP': ('THIRD_INDUSTRY_GDP', 'CHINA_THIRD_INDUSTRY_GDP'),
+    'THIRD_INDUSTRY_GDP_YOY': ('THIRD_INDUSTRY_GDP_YOY', 'CHINA_THIRD_INDUSTRY_GDP_YOY')
+}
+
+
 class MacroDataService:
     """Service for fetching and storing macroeconomic data."""
     
-    def __init__(self):
-        """Initialize the MacroDataService with FRED client and repository."""
-        self.fred_client = FredMacroDataClient()
-        self.yahoo_finance_client = YahooFinanceClient()
+    def __init__(
+        self,
+        fred_client: Optional[FredMacroDataClient] = None,
+        yahoo_finance_client: Optional[YahooFinanceClient] = None
+    ):
+        """
+        Initialize the MacroDataService with data clients and repository.
+        
+        Args:
+            fred_client (Optional[FredMacroDataClient]): FRED client to use (default: shared instance)
+            yahoo_finance_client (Optional[YahooFinanceClient]): Yahoo Finance client to use (default: shared instance)
+        """
+        self.fred_client = fred_client or get_fred_client()
+        self.yahoo_finance_client = yahoo_finance_client or get_yahoo_finance_client()
+        self.akshare_client = AkshareFinanceClient()
         self.repo = MacroIndicatorRepository()
         logger.info("MacroDataService initialized")
 
+    def close(self):
+        """
+        Release the HTTP session held by the FRED client and the database session.
+        
+        The FRED client is shared across service instances by default, so this is
+        meant to be called once when the application shuts down.
+        """
+        self.fred_client.close()
+        self.repo.close()
+
     def get_all_us_indicators(self, start_date: datetime, end_date: datetime):
         """
         Retrieve all US indicators within a specified date range from the database.
@@ -33,7 +217,7 @@ class MacroDataService:
         """
         try:
             logger.info("Retrieving US indicators from database for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+                       start_date.date(), end_date.date())
             indicators = self.repo.find_by_region_date_range(
                 start_date=start_date,
                 end_date=end_date,
@@ -58,8 +242,8 @@ class MacroDataService:
             # Structure the result dictionary
             result = {}
             for indicator_type, indicator_list in indicators_by_type.items():
-                # Sort indicators by date_time in descending order
-                sorted_indicators = sorted(indicator_list, key=lambda x: x['date_time'], reverse=True)
+                # Rows come back ordered by date_time, so reversing yields newest first
+                sorted_indicators = indicator_list[::-1]
                 
                 result[indicator_type] = {
                     "latest": sorted_indicators[0] if sorted_indicators else {},
@@ -88,7 +272,7 @@ class MacroDataService:
         """
         try:
             logger.info("Retrieving China indicators from database for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+                       start_date.date(), end_date.date())
             indicators = self.repo.find_by_region_date_range(
                 start_date=start_date,
                 end_date=end_date,
@@ -113,8 +297,8 @@ class MacroDataService:
             # Structure the result dictionary
             result = {}
             for indicator_type, indicator_list in indicators_by_type.items():
-                # Sort indicators by date_time in descending order
-                sorted_indicators = sorted(indicator_list, key=lambda x: x['date_time'], reverse=True)
+                # Rows come back ordered by date_time, so reversing yields newest first
+                sorted_indicators = indicator_list[::-1]
                 
                 result[indicator_type] = {
                     "latest": sorted_indicators[0] if sorted_indicators else {},
@@ -140,69 +324,20 @@ class MacroDataService:
         end_date = datetime.now()
         return self.fetch_and_store_leading_indicators_by_date_range(start_date, end_date)
 
-    def _save_leading_indicators_to_db(self, data: Dict[str, Optional[pd.Series]]):
+    def _collect_leading_indicator_rows(self, start_date: datetime, end_date: datetime) -> List[Dict]:
         """
-        Save the fetched indicators to the database.
+        Fetch the leading indicators from FRED and convert them into database rows.
         
         Args:
-            data: Dictionary containing the indicators data where keys are indicator types
-                 and values are pandas Series with the indicator values
+            start_date (datetime): Start date of the range (inclusive)
+            end_date (datetime): End date of the range (inclusive)
+        
+        Returns:
+            List[Dict]: Rows ready to be passed to MacroIndicatorRepository.bulk_upsert
         """
-        try:
-            saved_count = 0
-            
-            # Process US Leading Index
-            if 'leading_index_us' in data and data['leading_index_us'] is not None:
-                us_data = data['leading_index_us']
-                for date, value in us_data.items():
-                    if pd.notna(value):  # Check if value is not NaN
-                        # Check and delete existing record
-                        existing_record = self.repo.find_by_type_and_date("USALOLITOAASTSAM", date)
-                        if existing_record:
-                            self.repo.delete(existing_record)
-                            logger.debug("Deleted existing US_LEADING_INDEX record for date %s", date.strftime('%Y-%m-%d'))
-                        
-                        # Save new record
-                        self.repo.create(
-                            type="USALOLITOAASTSAM",
-                            name="US_LEADING_INDEX",
-                            value=float(value),
-                            date_time=date,
-                            is_leading_indicator=True,
-                            region="US"
-                        )
-                        saved_count += 1
-            
-            # Process BBK Index (German Leading Index)
-            if 'leading_index_de' in data and data['leading_index_de'] is not None:
-                de_data = data['leading_index_de']
-                for date, value in de_data.items():
-                    if pd.notna(value):  # Check if value is not NaN
-                        # Check and delete existing record
-                        existing_record = self.repo.find_by_type_and_date("BBKMLEIX", date)
-                        if existing_record:
-                            self.repo.delete(existing_record)
-                            logger.debug("Deleted existing BBK_LEADING_INDEX record for date %s", date.strftime('%Y-%m-%d'))
+        data = self.fred_client.get_leading_indicators(start_date, end_date)
+        return _series_group_rows(data, LEADING_INDICATOR_MAP, True)
 
-                        # Save new record
-                        self.repo.create(
-                            type="BBKMLEIX",
-                            name="BBK_LEADING_INDEX",
-                            value=float(value),
-                            date_time=date,
-                            is_leading_indicator=True,
-                            region="US"
-                        )
-                        saved_count += 1
-            
-            logger.info("Saved %d indicator records to database", saved_count)
-        except Exception as e:
-            logger.error("Error saving indicators to database: %s", str(e))
-            self.repo.session.rollback()
-            raise
-        finally:
-            self.repo.close()
-    
     def fetch_and_store_treasury_data(self, default_days: int = 180):
         """
         Fetch treasury yields and spreads from FRED and store them in the database.
@@ -214,55 +349,19 @@ class MacroDataService:
         end_date = datetime.now()
         return self.fetch_and_store_treasury_data_by_date_range(start_date, end_date)
 
-    def _save_treasury_data_to_db(self, data: Dict[str, Optional[pd.Series]]):
+    def _collect_treasury_rows(self, start_date: datetime, end_date: datetime) -> List[Dict]:
         """
-        Save the fetched treasury data to the database.
+        Fetch treasury yields and spreads from FRED and convert them into database rows.
         
         Args:
-            data: Dictionary containing the treasury yields and spreads where keys are indicator types
-                 and values are pandas Series with the indicator values
+            start_date (datetime): Start date of the range (inclusive)
+            end_date (datetime): End date of the range (inclusive)
+        
+        Returns:
+            List[Dict]: Rows ready to be passed to MacroIndicatorRepository.bulk_upsert
         """
-        try:
-            saved_count = 0
-            
-            # Map of data keys to database indicator types and names
-            treasury_indicators = {
-                'dgs3mo': ('DGS3MO', 'TREASURY_3M_YIELD'),
-                'dgs2': ('DGS2', 'TREASURY_2Y_YIELD'),
-                'dgs10': ('DGS10', 'TREASURY_10Y_YIELD'),
-                'spread_10y_2y': ('SPREAD_10Y_2Y', 'TREASURY_SPREAD_10Y_2Y'),
-                'spread_10y_3m': ('SPREAD_10Y_3M', 'TREASURY_SPREAD_10Y_3M')
-            }
-            
-            for data_key, (indicator_type, indicator_name) in treasury_indicators.items():
-                series = data.get(data_key)
-                if series is not None and not series.empty:
-                    for date, value in series.items():
-                        if pd.notna(value):  # Check if value is not NaN
-                            # Check and delete existing record
-                            existing_record = self.repo.find_by_type_and_date(indicator_type, date)
-                            if existing_record:
-                                self.repo.delete(existing_record)
-                                logger.debug("Deleted existing %s record for date %s", indicator_name, date.strftime('%Y-%m-%d'))
-                            
-                            # Save new record
-                            self.repo.create(
-                                type=indicator_type,
-                                name=indicator_name,
-                                value=float(value),
-                                date_time=date,
-                                is_leading_indicator=False,
-                                region="US"
-                            )
-                            saved_count += 1
-            
-            logger.info("Saved %d treasury records to database", saved_count)
-        except Exception as e:
-            logger.error("Error saving treasury data to database: %s", str(e))
-            self.repo.session.rollback()
-            raise
-        finally:
-            self.repo.close()
+        data = self.fred_client.get_treasury_yields_and_spreads(start_date, end_date)
+        return _series_group_rows(data, TREASURY_MAP)
 
     def fetch_and_store_consumer_indices(self, default_days: int = 180):
         """
@@ -274,54 +373,20 @@ class MacroDataService:
         start_date = datetime.now() - timedelta(days=default_days)
         end_date = datetime.now()
         return self.fetch_and_store_consumer_indices_by_date_range(start_date, end_date)
-    
-    def _save_consumer_indices_to_db(self, data: Dict[str, Optional[pd.Series]]):
+
+    def _collect_consumer_index_rows(self, start_date: datetime, end_date: datetime) -> List[Dict]:
         """
-        Save the fetched consumer indices to the database.
+        Fetch consumer-related indices from FRED and convert them into database rows.
         
         Args:
-            data: Dictionary containing the consumer indices where keys are indicator types
-                 and values are pandas Series with the indicator values
+            start_date (datetime): Start date of the range (inclusive)
+            end_date (datetime): End date of the range (inclusive)
+        
+        Returns:
+            List[Dict]: Rows ready to be passed to MacroIndicatorRepository.bulk_upsert
         """
-        try:
-            saved_count = 0
-            
-            # Map of data keys to database indicator types and names
-            consumer_indicators = {
-                'consumer_credit': ('TOTALSL', 'CONSUMER_CREDIT'),
-                'consumer_sentiment': ('UMCSENT', 'CONSUMER_SENTIMENT'),
-                'disposable_income': ('DSPIC96', 'DISPOSABLE_INCOME')
-            }
-            
-            for data_key, (indicator_type, indicator_name) in consumer_indicators.items():
-                series = data.get(data_key)
-                if series is not None and not series.empty:
-                    for date, value in series.items():
-                        if pd.notna(value):  # Check if value is not NaN
-                            # Check and delete existing record
-                            existing_record = self.repo.find_by_type_and_date(indicator_type, date)
-                            if existing_record:
-                                self.repo.delete(existing_record)
-                                logger.debug("Deleted existing %s record for date %s", indicator_name, date.strftime('%Y-%m-%d'))
-                            
-                            # Save new record
-                            self.repo.create(
-                                type=indicator_type,
-                                name=indicator_name,
-                                value=float(value),
-                                date_time=date,
-                                is_leading_indicator=False,
-                                region="US"
-                            )
-                            saved_count += 1
-            
-            logger.info("Saved %d consumer index records to database", saved_count)
-        except Exception as e:
-            logger.error("Error saving consumer indices to database: %s", str(e))
-            self.repo.session.rollback()
-            raise
-        finally:
-            self.repo.close()
+        data = self.fred_client.get_consumer_indices(start_date, end_date)
+        return _series_group_rows(data, CONSUMER_MAP)
 
     def fetch_and_store_financial_condition_indices(self, default_days: int = 180):
         """
@@ -333,110 +398,20 @@ class MacroDataService:
         start_date = datetime.now() - timedelta(days=default_days)
         end_date = datetime.now()
         return self.fetch_and_store_financial_condition_indices_by_date_range(start_date, end_date)
-    
-    def _save_financial_condition_indices_to_db(self, data: Dict[str, Optional[pd.Series]]):
-        """
-        Save the fetched financial condition indices to the database.
-        
-        Args:
-            data: Dictionary containing the financial condition indices where keys are indicator types
-                 and values are pandas Series with the indicator values
-        """
-        try:
-            saved_count = 0
-            
-            # Map of data keys to database indicator types and names
-            financial_indicators = {
-                'national_financial_conditions': ('NFCI', 'NATIONAL_FINANCIAL_CONDITIONS'),
-                'adjusted_financial_conditions': ('ANFCI', 'ADJUSTED_FINANCIAL_CONDITIONS')
-            }
-            
-            for data_key, (indicator_type, indicator_name) in financial_indicators.items():
-                series = data.get(data_key)
-                if series is not None and not series.empty:
-                    for date, value in series.items():
-                        if pd.notna(value):  # Check if value is not NaN
-                            # Check and delete existing record
-                            existing_record = self.repo.find_by_type_and_date(indicator_type, date)
-                            if existing_record:
-                                self.repo.delete(existing_record)
-                                logger.debug("Deleted existing %s record for date %s", indicator_name, date.strftime('%Y-%m-%d'))
-                            
-                            # Save new record
-                            self.repo.create(
-                                type=indicator_type,
-                                name=indicator_name,
-                                value=float(value),
-                                date_time=date,
-                                is_leading_indicator=False,
-                                region="US"
-                            )
-                            saved_count += 1
-            
-            logger.info("Saved %d financial condition index records to database", saved_count)
-        except Exception as e:
-            logger.error("Error saving financial condition indices to database: %s", str(e))
-            self.repo.session.rollback()
-            raise
-        finally:
-            self.repo.close()
 
-    def fetch_and_store_pmi_indicators(self, default_days: int = 180):
+    def _collect_financial_condition_index_rows(self, start_date: datetime, end_date: datetime) -> List[Dict]:
         """
-        Fetch PMI indicators from Trading Economics and store them in the database.
+        Fetch financial condition indices from FRED and convert them into database rows.
         
         Args:
-            default_days (int): Number of days to look back for data (default: 180)
-        """
-        start_date = datetime.now() - timedelta(days=default_days)
-        end_date = datetime.now()
-        return self.fetch_and_store_pmi_indicators_by_date_range(start_date, end_date)
-    
-    def _save_pmi_indicators_to_db(self, data: Dict[str, Optional[float]]):
-        """
-        Save the fetched PMI indicators to the database.
+            start_date (datetime): Start date of the range (inclusive)
+            end_date (datetime): End date of the range (inclusive)
         
-        Args:
-            data: Dictionary containing the PMI indicators
+        Returns:
+            List[Dict]: Rows ready to be passed to MacroIndicatorRepository.bulk_upsert
         """
-        try:
-            saved_count = 0
-            current_date = datetime.now()
-            
-            # Map of data keys to database indicator types and names
-            pmi_indicators = {
-                'manufacturing_pmi': ('ISM_MAN_PMI', 'MANUFACTURING_PMI'),
-                'services_pmi': ('ISM_SERV_PMI', 'SERVICES_PMI'),
-                'composite_pmi': ('COMP_PMI', 'COMPOSITE_PMI')
-            }
-            
-            for data_key, (indicator_type, indicator_name) in pmi_indicators.items():
-                value = data.get(data_key)
-                if value is not None:
-                    # Check and delete existing record
-                    existing_record = self.repo.find_by_type_and_date(indicator_type, current_date)
-                    if existing_record:
-                        self.repo.delete(existing_record)
-                        logger.debug("Deleted existing %s record for date %s", indicator_name, current_date.strftime('%Y-%m-%d'))
-                    
-                    # Save new record
-                    self.repo.create(
-                        type=indicator_type,
-                        name=indicator_name,
-                        value=float(value),
-                        date_time=current_date,
-                        is_leading_indicator=False,
-                        region="US"
-                    )
-                    saved_count += 1
-            
-            logger.info("Saved %d PMI indicator records to database", saved_count)
-        except Exception as e:
-            logger.error("Error saving PMI indicators to database: %s", str(e))
-            self.repo.session.rollback()
-            raise
-        finally:
-            self.repo.close()
+        data = self.fred_client.get_financial_condition_indices(start_date, end_date)
+        return _series_group_rows(data, FINANCIAL_CONDITION_MAP)
 
     def fetch_and_store_commodity_prices(self, default_days: int = 180):
         """
@@ -448,551 +423,205 @@ class MacroDataService:
         start_date = datetime.now() - timedelta(days=default_days)
         end_date = datetime.now()
         return self.fetch_and_store_commodity_prices_by_date_range(start_date, end_date)
-    
-    def _save_commodity_prices_to_db(self, data: Dict[str, Optional[pd.Series]]):
-        """
-        Save the fetched commodity prices to the database.
-        
-        Args:
-            data: Dictionary containing the commodity prices where keys are indicator types
-                 and values are pandas Series with the indicator values
-        """
-        try:
-            saved_count = 0
-            
-            # Map of data keys to database indicator types and names
-            commodity_indicators = {
-                'crude_oil': ('CRUDE_OIL_FUT', 'CRUDE_OIL_FUTURES'),
-                'gold': ('GOLD_FUT', 'GOLD_FUTURES')
-            }
-            
-            for data_key, (indicator_type, indicator_name) in commodity_indicators.items():
-                series = data.get(data_key)
-                if series is not None and not series.empty:
-                    for date, value in series.items():
-                        if pd.notna(value):  # Check if value is not NaN
-                            # Check and delete existing record
-                            existing_record = self.repo.find_by_type_and_date(indicator_type, date)
-                            if existing_record:
-                                self.repo.delete(existing_record)
-                                logger.debug("Deleted existing %s record for date %s", indicator_name, date.strftime('%Y-%m-%d'))
-                            
-                            # Save new record
-                            self.repo.create(
-                                type=indicator_type,
-                                name=indicator_name,
-                                value=float(value),
-                                date_time=date,
-                                is_leading_indicator=False,
-                                region="US"
-                            )
-                            saved_count += 1
-            
-            logger.info("Saved %d commodity price records to database", saved_count)
-        except Exception as e:
-            logger.error("Error saving commodity prices to database: %s", str(e))
-            self.repo.session.rollback()
-            raise
-        finally:
-            self.repo.close()
 
-    def fetch_and_store_leading_indicators_by_date_range(self, start_date: datetime, end_date: datetime):
+    def _collect_commodity_price_rows(self, start_date: datetime, end_date: datetime) -> List[Dict]:
         """
-        Fetch indicators from FRED and store them in the database for a specific date range.
+        Fetch the latest commodity prices from Yahoo Finance and convert them into database rows.
         
-        Args:
-            start_date (datetime): Start date of the range (inclusive)
-            end_date (datetime): End date of the range (inclusive)
-            
-        Returns:
-            bool: True if operation was successful
-        """
-        try:
-            logger.info("Fetching indicators from FRED for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-            combined_data = self.fred_client.get_leading_indicators(start_date, end_date)
-            self._save_leading_indicators_to_db(combined_data)
-            logger.info("Successfully fetched and stored indicators")
-            return True
-        except Exception as e:
-            logger.error("Error in fetch_and_store_indicators_by_date_range: %s", str(e))
-            raise
-
-    def fetch_and_store_treasury_data_by_date_range(self, start_date: datetime, end_date: datetime):
-        """
-        Fetch treasury yields and spreads from FRED and store them in the database for a specific date range.
+        The client only returns the latest price per commodity, so each value is stored
+        against the end date of the requested range.
         
         Args:
             start_date (datetime): Start date of the range (inclusive)
             end_date (datetime): End date of the range (inclusive)
-            
-        Returns:
-            bool: True if operation was successful
-        """
-        try:
-            logger.info("Fetching treasury data from FRED for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-            treasury_data = self.fred_client.get_treasury_yields_and_spreads(start_date, end_date)
-            self._save_treasury_data_to_db(treasury_data)
-            logger.info("Successfully fetched and stored treasury data")
-            return True
-        except Exception as e:
-            logger.error("Error in fetch_and_store_treasury_data_by_date_range: %s", str(e))
-            raise
-
-    def fetch_and_store_consumer_indices_by_date_range(self, start_date: datetime, end_date: datetime):
-        """
-        Fetch consumer-related indices from FRED and store them in the database for a specific date range.
         
-        Args:
-            start_date (datetime): Start date of the range (inclusive)
-            end_date (datetime): End date of the range (inclusive)
-            
         Returns:
-            bool: True if operation was successful
+            List[Dict]: Rows ready to be passed to MacroIndicatorRepository.bulk_upsert
         """
-        try:
-            logger.info("Fetching consumer indices from FRED for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-            consumer_data = self.fred_client.get_consumer_indices(start_date, end_date)
-            self._save_consumer_indices_to_db(consumer_data)
-            logger.info("Successfully fetched and stored consumer indices")
-            return True
-        except Exception as e:
-            logger.error("Error in fetch_and_store_consumer_indices_by_date_range: %s", str(e))
-            raise
+        data = self.yahoo_finance_client.get_commodity_prices(start_date, end_date)
+        return _scalar_rows(data, COMMODITY_MAP, _start_of_day(end_date))
 
-    def fetch_and_store_financial_condition_indices_by_date_range(self, start_date: datetime, end_date: datetime):
+    def _collect_china_gdp_rows(self, start_date: datetime, end_date: datetime) -> List[Dict]:
         """
-        Fetch financial condition indices from FRED and store them in the database for a specific date range.
+        Fetch China GDP growth data from Akshare and convert it into database rows.
         
         Args:
             start_date (datetime): Start date of the range (inclusive)
             end_date (datetime): End date of the range (inclusive)
-            
-        Returns:
-            bool: True if operation was successful
-        """
-        try:
-            logger.info("Fetching financial condition indices from FRED for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-            financial_data = self.fred_client.get_financial_condition_indices(start_date, end_date)
-            self._save_financial_condition_indices_to_db(financial_data)
-            logger.info("Successfully fetched and stored financial condition indices")
-            return True
-        except Exception as e:
-            logger.error("Error in fetch_and_store_financial_condition_indices_by_date_range: %s", str(e))
-            raise
-
-    def fetch_and_store_commodity_prices_by_date_range(self, start_date: datetime, end_date: datetime):
-        """
-        Fetch commodity prices from Yahoo Finance and store them in the database for a specific date range.
         
-        Args:
-            start_date (datetime): Start date of the range (inclusive)
-            end_date (datetime): End date of the range (inclusive)
-            
         Returns:
-            bool: True if operation was successful
+            List[Dict]: Rows ready to be passed to MacroIndicatorRepository.bulk_upsert
         """
-        try:
-            logger.info("Fetching commodity prices from Yahoo Finance for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-            commodity_data = self.yahoo_finance_client.get_commodity_prices(start_date, end_date)
-            self._save_commodity_prices_to_db(commodity_data)
-            logger.info("Successfully fetched and stored commodity prices")
-            return True
-        except Exception as e:
-            logger.error("Error in fetch_and_store_commodity_prices_by_date_range: %s", str(e))
-            raise
+        gdp_data = self.akshare_client.get_china_gdp_growth(start_date, end_date)
+        return _series_group_rows(gdp_data, CHINA_GDP_MAP, True, "CHINA")
 
-    def fetch_and_store_leading_index(self, start_date: datetime, end_date: datetime):
+    def _row_collectors(self) -> Dict[str, Callable[[datetime, datetime], List[Dict]]]:
         """
-        Fetch and store US Leading Index for a specific date range.
+        Map each indicator group to the method that fetches it and builds its database rows.
         
-        Args:
-            start_date (datetime): Start date of the range (inclusive)
-            end_date (datetime): End date of the range (inclusive)
-            
         Returns:
-            bool: True if operation was successful
-        """
-        try:
-            logger.info("Fetching US Leading Index from FRED for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-            data = self.fred_client.get_leading_index(start_date, end_date)
-            if data is not None and not data.empty:
-                for _, row in data.iterrows():
-                    date = row['date']
-                    value = float(row['leading_index'])
-                    
-                    # Check and delete existing record
-                    existing_record = self.repo.find_by_type_and_date("USALOLITOAASTSAM", date)
-                    if existing_record:
-                        self.repo.delete(existing_record)
-                    
-                    # Save new record
-                    self.repo.create(
-                        type="USALOLITOAASTSAM",
-                        name="US_LEADING_INDEX",
-                        value=value,
-                        date_time=date,
-                        is_leading_indicator=True,
-                        region="US"
-                    )
-            logger.info("Successfully fetched and stored US Leading Index")
-            return True
-        except Exception as e:
-            logger.error("Error in fetch_and_store_leading_index: %s", str(e))
-            raise
-        finally:
-            self.repo.close()
+            Dict[str, Callable[[datetime, datetime], List[Dict]]]: Row collectors keyed by group name
+        """
+        return {
+            "leading_indicators": self._collect_leading_indicator_rows,
+            "treasury_data": self._collect_treasury_rows,
+            "consumer_indices": self._collect_consumer_index_rows,
+            "financial_condition_indices": self._collect_financial_condition_index_rows,
+            "commodity_prices": self._collect_commodity_price_rows,
+            "china_gdp_data": self._collect_china_gdp_rows
+        }
 
-    def fetch_and_store_bbk_index(self, start_date: datetime, end_date: datetime):
+    def _store_rows(self, rows: List[Dict]) -> int:
         """
-        Fetch and store BBK Leading Index for a specific date range.
+        Write rows with a single bulk upsert in a session scoped to this call.
         
-        Args:
-            start_date (datetime): Start date of the range (inclusive)
-            end_date (datetime): End date of the range (inclusive)
-            
-        Returns:
-            bool: True if operation was successful
-        """
-        try:
-            logger.info("Fetching BBK Leading Index from FRED for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-            data = self.fred_client.get_bbk_index(start_date, end_date)
-            if data is not None and not data.empty:
-                for _, row in data.iterrows():
-                    date = row['date']
-                    value = float(row['bbk_index'])
-                    
-                    # Check and delete existing record
-                    existing_record = self.repo.find_by_type_and_date("BBKMLEIX", date)
-                    if existing_record:
-                        self.repo.delete(existing_record)
-                    
-                    # Save new record
-                    self.repo.create(
-                        type="BBKMLEIX",
-                        name="BBK_LEADING_INDEX",
-                        value=value,
-                        date_time=date,
-                        is_leading_indicator=True,
-                        region="US"
-                    )
-            logger.info("Successfully fetched and stored BBK Leading Index")
-            return True
-        except Exception as e:
-            logger.error("Error in fetch_and_store_bbk_index: %s", str(e))
-            raise
-        finally:
-            self.repo.close()
-
-    def fetch_and_store_treasury_yield_3m(self, start_date: datetime, end_date: datetime):
-        """
-        Fetch and store 3-Month Treasury Yield for a specific date range.
+        The session is committed, or rolled back on error, and closed before returning,
+        so writes made from worker threads do not leave a session behind.
         
         Args:
-            start_date (datetime): Start date of the range (inclusive)
-            end_date (datetime): End date of the range (inclusive)
-            
-        Returns:
-            bool: True if operation was successful
-        """
-        try:
-            logger.info("Fetching 3-Month Treasury Yield from FRED for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-            data = self.fred_client.get_treasury_yield_3m(start_date, end_date)
-            if data is not None:
-                # Check and delete existing record
-                existing_record = self.repo.find_by_type_and_date("DGS3MO", end_date)
-                if existing_record:
-                    self.repo.delete(existing_record)
-                
-                # Save new record
-                self.repo.create(
-                    type="DGS3MO",
-                    name="TREASURY_3M_YIELD",
-                    value=float(data),
-                    date_time=end_date,
-                    is_leading_indicator=False,
-                    region="US"
-                )
-            logger.info("Successfully fetched and stored 3-Month Treasury Yield")
-            return True
-        except Exception as e:
-            logger.error("Error in fetch_and_store_treasury_yield_3m: %s", str(e))
-            raise
-        finally:
-            self.repo.close()
-
-    def fetch_and_store_treasury_yield_2y(self, start_date: datetime, end_date: datetime):
-        """
-        Fetch and store 2-Year Treasury Yield for a specific date range.
+            rows (List[Dict]): Rows built by one of the row collectors
         
-        Args:
-            start_date (datetime): Start date of the range (inclusive)
-            end_date (datetime): End date of the range (inclusive)
-            
         Returns:
-            bool: True if operation was successful
+            int: Number of rows written
         """
-        try:
-            logger.info("Fetching 2-Year Treasury Yield from FRED for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-            data = self.fred_client.get_treasury_yield_2y(start_date, end_date)
-            if data is not None:
-                # Check and delete existing record
-                existing_record = self.repo.find_by_type_and_date("DGS2", end_date)
-                if existing_record:
-                    self.repo.delete(existing_record)
-                
-                # Save new record
-                self.repo.create(
-                    type="DGS2",
-                    name="TREASURY_2Y_YIELD",
-                    value=float(data),
-                    date_time=end_date,
-                    is_leading_indicator=False,
-                    region="US"
-                )
-            logger.info("Successfully fetched and stored 2-Year Treasury Yield")
-            return True
-        except Exception as e:
-            logger.error("Error in fetch_and_store_treasury_yield_2y: %s", str(e))
-            raise
-        finally:
-            self.repo.close()
+        with get_db_session() as session:
+            return MacroIndicatorRepository(session).bulk_upsert(rows)
 
-    def fetch_and_store_treasury_yield_10y(self, start_date: datetime, end_date: datetime):
+    def fetch_and_store_leading_indicators_by_date_range(self, start_date: datetime, end_date: datetime):
         """
-        Fetch and store 10-Year Treasury Yield for a specific date range.
+        Fetch indicators from FRED and store them in the database for a specific date range.
         
         Args:
             start_date (datetime): Start date of the range (inclusive)
             end_date (datetime): End date of the range (inclusive)
-            
+        
         Returns:
             bool: True if operation was successful
         """
-        try:
-            logger.info("Fetching 10-Year Treasury Yield from FRED for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-            data = self.fred_client.get_treasury_yield_10y(start_date, end_date)
-            if data is not None:
-                # Check and delete existing record
-                existing_record = self.repo.find_by_type_and_date("DGS10", end_date)
-                if existing_record:
-                    self.repo.delete(existing_record)
-                
-                # Save new record
-                self.repo.create(
-                    type="DGS10",
-                    name="TREASURY_10Y_YIELD",
-                    value=float(data),
-                    date_time=end_date,
-                    is_leading_indicator=False,
-                    region="US"
-                )
-            logger.info("Successfully fetched and stored 10-Year Treasury Yield")
+        with _log_and_reraise("fetch_and_store_leading_indicators_by_date_range"):
+            logger.info("Fetching indicators from FRED for period %s to %s",
+                       start_date.date(), end_date.date())
+            saved_count = self._store_rows(self._collect_leading_indicator_rows(start_date, end_date))
+            logger.info("Successfully fetched and stored %d indicator records", saved_count)
             return True
-        except Exception as e:
-            logger.error("Error in fetch_and_store_treasury_yield_10y: %s", str(e))
-            raise
-        finally:
-            self.repo.close()
 
-    def fetch_and_store_consumer_credit(self, start_date: datetime, end_date: datetime):
+    def fetch_and_store_treasury_data_by_date_range(self, start_date: datetime, end_date: datetime):
         """
-        Fetch and store Consumer Credit for a specific date range.
+        Fetch treasury yields and spreads from FRED and store them in the database for a specific date range.
         
         Args:
             start_date (datetime): Start date of the range (inclusive)
             end_date (datetime): End date of the range (inclusive)
-            
+        
         Returns:
             bool: True if operation was successful
         """
-        try:
-            logger.info("Fetching Consumer Credit from FRED for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-            data = self.fred_client.get_consumer_credit(start_date, end_date)
-            if data is not None:
-                # Check and delete existing record
-                existing_record = self.repo.find_by_type_and_date("TOTALSL", end_date)
-                if existing_record:
-                    self.repo.delete(existing_record)
-                
-                # Save new record
-                self.repo.create(
-                    type="TOTALSL",
-                    name="CONSUMER_CREDIT",
-                    value=float(data),
-                    date_time=end_date,
-                    is_leading_indicator=False,
-                    region="US"
-                )
-            logger.info("Successfully fetched and stored Consumer Credit")
+        with _log_and_reraise("fetch_and_store_treasury_data_by_date_range"):
+            logger.info("Fetching treasury data from FRED for period %s to %s",
+                       start_date.date(), end_date.date())
+            saved_count = self._store_rows(self._collect_treasury_rows(start_date, end_date))
+            logger.info("Successfully fetched and stored %d treasury records", saved_count)
             return True
-        except Exception as e:
-            logger.error("Error in fetch_and_store_consumer_credit: %s", str(e))
-            raise
-        finally:
-            self.repo.close()
 
-    def fetch_and_store_consumer_sentiment(self, start_date: datetime, end_date: datetime):
+    def fetch_and_store_consumer_indices_by_date_range(self, start_date: datetime, end_date: datetime):
         """
-        Fetch and store Consumer Sentiment for a specific date range.
+        Fetch consumer-related indices from FRED and store them in the database for a specific date range.
         
         Args:
             start_date (datetime): Start date of the range (inclusive)
             end_date (datetime): End date of the range (inclusive)
-            
+        
         Returns:
             bool: True if operation was successful
         """
-        try:
-            logger.info("Fetching Consumer Sentiment from FRED for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-            data = self.fred_client.get_consumer_sentiment(start_date, end_date)
-            if data is not None:
-                # Check and delete existing record
-                existing_record = self.repo.find_by_type_and_date("UMCSENT", end_date)
-                if existing_record:
-                    self.repo.delete(existing_record)
-                
-                # Save new record
-                self.repo.create(
-                    type="UMCSENT",
-                    name="CONSUMER_SENTIMENT",
-                    value=float(data),
-                    date_time=end_date,
-                    is_leading_indicator=False,
-                    region="US"
-                )
-            logger.info("Successfully fetched and stored Consumer Sentiment")
+        with _log_and_reraise("fetch_and_store_consumer_indices_by_date_range"):
+            logger.info("Fetching consumer indices from FRED for period %s to %s",
+                       start_date.date(), end_date.date())
+            saved_count = self._store_rows(self._collect_consumer_index_rows(start_date, end_date))
+            logger.info("Successfully fetched and stored %d consumer index records", saved_count)
             return True
-        except Exception as e:
-            logger.error("Error in fetch_and_store_consumer_sentiment: %s", str(e))
-            raise
-        finally:
-            self.repo.close()
 
-    def fetch_and_store_disposable_income(self, start_date: datetime, end_date: datetime):
+    def fetch_and_store_financial_condition_indices_by_date_range(self, start_date: datetime, end_date: datetime):
         """
-        Fetch and store Disposable Income for a specific date range.
+        Fetch financial condition indices from FRED and store them in the database for a specific date range.
         
         Args:
             start_date (datetime): Start date of the range (inclusive)
             end_date (datetime): End date of the range (inclusive)
-            
+        
         Returns:
             bool: True if operation was successful
         """
-        try:
-            logger.info("Fetching Disposable Income from FRED for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-            data = self.fred_client.get_disposable_income(start_date, end_date)
-            if data is not None:
-                # Check and delete existing record
-                existing_record = self.repo.find_by_type_and_date("DSPIC96", end_date)
-                if existing_record:
-                    self.repo.delete(existing_record)
-                
-                # Save new record
-                self.repo.create(
-                    type="DSPIC96",
-                    name="DISPOSABLE_INCOME",
-                    value=float(data),
-                    date_time=end_date,
-                    is_leading_indicator=False,
-                    region="US"
-                )
-            logger.info("Successfully fetched and stored Disposable Income")
+        with _log_and_reraise("fetch_and_store_financial_condition_indices_by_date_range"):
+            logger.info("Fetching financial condition indices from FRED for period %s to %s",
+                       start_date.date(), end_date.date())
+            saved_count = self._store_rows(self._collect_financial_condition_index_rows(start_date, end_date))
+            logger.info("Successfully fetched and stored %d financial condition index records", saved_count)
             return True
-        except Exception as e:
-            logger.error("Error in fetch_and_store_disposable_income: %s", str(e))
-            raise
-        finally:
-            self.repo.close()
 
-    def fetch_and_store_crude_oil(self, start_date: datetime, end_date: datetime):
+    def fetch_and_store_commodity_prices_by_date_range(self, start_date: datetime, end_date: datetime):
         """
-        Fetch and store Crude Oil Futures price for a specific date range.
+        Fetch commodity prices from Yahoo Finance and store them in the database for a specific date range.
         
         Args:
             start_date (datetime): Start date of the range (inclusive)
             end_date (datetime): End date of the range (inclusive)
-            
+        
         Returns:
             bool: True if operation was successful
         """
-        try:
-            logger.info("Fetching Crude Oil Futures from Yahoo Finance for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-            data = self.yahoo_finance_client.get_crude_oil_price(start_date, end_date)
-            if data is not None:
-                # Check and delete existing record
-                existing_record = self.repo.find_by_type_and_date("CRUDE_OIL_FUT", end_date)
-                if existing_record:
-                    self.repo.delete(existing_record)
-                
-                # Save new record
-                self.repo.create(
-                    type="CRUDE_OIL_FUT",
-                    name="CRUDE_OIL_FUTURES",
-                    value=float(data),
-                    date_time=end_date,
-                    is_leading_indicator=False,
-                    region="US"
-                )
-            logger.info("Successfully fetched and stored Crude Oil Futures")
+        with _log_and_reraise("fetch_and_store_commodity_prices_by_date_range"):
+            logger.info("Fetching commodity prices from Yahoo Finance for period %s to %s",
+                       start_date.date(), end_date.date())
+            saved_count = self._store_rows(self._collect_commodity_price_rows(start_date, end_date))
+            logger.info("Successfully fetched and stored %d commodity price records", saved_count)
             return True
-        except Exception as e:
-            logger.error("Error in fetch_and_store_crude_oil: %s", str(e))
-            raise
-        finally:
-            self.repo.close()
 
-    def fetch_and_store_gold(self, start_date: datetime, end_date: datetime):
+    async def fetch_all(self, start_date: datetime, end_date: datetime) -> Dict[str, Union[bool, Exception]]:
         """
-        Fetch and store Gold Futures price for a specific date range.
+        Fetch all indicators concurrently for a specific date range and store them in one batch.
+        
+        Each fetch runs in a worker thread so the network round-trips to FRED,
+        Yahoo Finance and Akshare overlap instead of running back to back, with at
+        most FETCH_ALL_MAX_CONCURRENCY fetches in flight. The rows of every successful
+        fetch are then written with a single bulk upsert.
         
         Args:
             start_date (datetime): Start date of the range (inclusive)
             end_date (datetime): End date of the range (inclusive)
-            
+        
         Returns:
-            bool: True if operation was successful
-        """
-        try:
-            logger.info("Fetching Gold Futures from Yahoo Finance for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-            data = self.yahoo_finance_client.get_gold_price(start_date, end_date)
-            if data is not None:
-                # Check and delete existing record
-                existing_record = self.repo.find_by_type_and_date("GOLD_FUT", end_date)
-                if existing_record:
-                    self.repo.delete(existing_record)
-                
-                # Save new record
-                self.repo.create(
-                    type="GOLD_FUT",
-                    name="GOLD_FUTURES",
-                    value=float(data),
-                    date_time=end_date,
-                    is_leading_indicator=False,
-                    region="US"
-                )
-            logger.info("Successfully fetched and stored Gold Futures")
-            return True
-        except Exception as e:
-            logger.error("Error in fetch_and_store_gold: %s", str(e))
-            raise
-        finally:
-            self.repo.close()
+            Dict[str, Union[bool, Exception]]: True for every successful fetch, or the
+                                               exception raised by a failed one
+        """
+        collectors = self._row_collectors()
+        semaphore = asyncio.Semaphore(FETCH_ALL_MAX_CONCURRENCY)
+        
+        async def collect(collect_rows: Callable[[datetime, datetime], List[Dict]]) -> List[Dict]:
+            async with semaphore:
+                return await asyncio.to_thread(collect_rows, start_date, end_date)
+        
+        logger.info("Fetching all indicators concurrently for period %s to %s",
+                   start_date.date(), end_date.date())
+        outcomes = await asyncio.gather(
+            *(collect(collect_rows) for collect_rows in collectors.values()),
+            return_exceptions=True
+        )
+        
+        results: Dict[str, Union[bool, Exception]] = {}
+        rows = []
+        for name, outcome in zip(collectors.keys(), outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.error("Error in fetch_all for %s: %s", name, str(outcome))
+                results[name] = outcome
+            else:
+                rows.extend(outcome)
+                results[name] = True
+        
+        # Skip the worker thread hop entirely when every fetch came back empty or failed
+        saved_count = await asyncio.to_thread(self._store_rows, rows) if rows else 0
+        logger.info("Completed fetching all indicators, stored %d records", saved_count)
+        return results
 
     def fetch_and_store_china_gdp_growth(self, default_days: int = 180):
         """
@@ -1012,62 +641,13 @@ class MacroDataService:
         Args:
             start_date (datetime): Start date of the range (inclusive)
             end_date (datetime): End date of the range (inclusive)
-            
+        
         Returns:
             bool: True if operation was successful
         """
-        try:
-            logger.info("Fetching China GDP growth data from Akshare for period %s to %s", 
-                       start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-            
-            # Initialize Akshare client
-            akshare_client = AkshareFinanceClient()
-            
-            # Fetch GDP data
-            gdp_data = akshare_client.get_china_gdp_growth(start_date, end_date)
-            
-            # Save the data
-            saved_count = 0
-            
-            # Map of data keys to database indicator types and names
-            gdp_indicators = {
-                'GDP': ('GDP', 'CHINA_GDP'),
-                'GDP_YOY': ('GDP_YOY', 'CHINA_GDP_YOY'),
-                'FIRST_INDUSTRY_GDP': ('FIRST_INDUSTRY_GDP', 'CHINA_FIRST_INDUSTRY_GDP'),
-                'FIRST_INDUSTRY_GDP_YOY': ('FIRST_INDUSTRY_GDP_YOY', 'CHINA_FIRST_INDUSTRY_GDP_YOY'),
-                'SECOND_INDUSTRY_GDP': ('SECOND_INDUSTRY_GDP', 'CHINA_SECOND_INDUSTRY_GDP'),
-                'SECOND_INDUSTRY_GDP_YOY': ('SECOND_INDUSTRY_GDP_YOY', 'CHINA_SECOND_INDUSTRY_GDP_YOY'),
-                'THIRD_INDUSTRY_GDP': ('THIRD_INDUSTRY_GDP', 'CHINA_THIRD_INDUSTRY_GDP'),
-                'THIRD_INDUSTRY_GDP_YOY': ('THIRD_INDUSTRY_GDP_YOY', 'CHINA_THIRD_INDUSTRY_GDP_YOY')
-            }
-            
-            for data_key, (indicator_type, indicator_name) in gdp_indicators.items():
-                series = gdp_data.get(data_key)
-                if series is not None and not series.empty:
-                    for date, value in series.items():
-                        if pd.notna(value):  # Check if value is not NaN
-                            # Check and delete existing record
-                            existing_record = self.repo.find_by_type_and_date(indicator_type, date)
-                            if existing_record:
-                                self.repo.delete(existing_record)
-                                logger.debug("Deleted existing %s record for date %s", indicator_name, date.strftime('%Y-%m-%d'))
-                            
-                            # Save new record
-                            self.repo.create(
-                                type=indicator_type,
-                                name=indicator_name,
-                                value=float(value),
-                                date_time=date,
-                                is_leading_indicator=True,
-                                region="CHINA"
-                            )
-                            saved_count += 1
-            
+        with _log_and_reraise("fetch_and_store_china_gdp_growth_by_date_range"):
+            logger.info("Fetching China GDP growth data from Akshare for period %s to %s",
+                       start_date.date(), end_date.date())
+            saved_count = self._store_rows(self._collect_china_gdp_rows(start_date, end_date))
             logger.info("Successfully fetched and stored GDP growth data. Saved %d records.", saved_count)
             return True
-        except Exception as e:
-            logger.error("Error in fetch_and_store_gdp_growth_by_date_range: %s", str(e))
-            raise
-        finally:
-            self.repo.close()
-
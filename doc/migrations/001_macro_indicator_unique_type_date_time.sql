@@ -0,0 +1,41 @@
+-- Add the (type, date_time) unique key that MacroIndicatorRepository.bulk_upsert relies on
+-- for INSERT ... ON DUPLICATE KEY UPDATE.
+--
+-- Existing tables were created without the key, and older point-in-time values (PMI,
+-- commodity prices) were stored with the wall-clock time of the fetch, so the same
+-- (type, day) may appear several times. Normalise every date_time to midnight, keep the
+-- most recently inserted row of each (type, date_time) and only then add the key.
+-- The same migration narrows type / region to match the model and adds the
+-- (region, date_time) index used by find_by_region_date_range.
+--
+-- Back up the table first; the DELETE cannot be undone.
+--
+-- Usage: mysql -u <user> -p investment_dashboard < doc/migrations/001_macro_indicator_unique_type_date_time.sql
+
+-- 1. Store every value against the start of its day, as the service now does
+UPDATE macro_indicator
+SET date_time = DATE(date_time)
+WHERE TIME(date_time) <> '00:00:00';
+
+-- 2. Drop duplicates, keeping the row with the highest id (the latest insert)
+DELETE older
+FROM macro_indicator AS older
+JOIN macro_indicator AS newer
+    ON newer.type = older.type
+    AND newer.date_time = older.date_time
+    AND newer.id > older.id;
+
+-- 3. Add the unique key used by the upsert
+ALTER TABLE macro_indicator
+    ADD CONSTRAINT uq_macro_indicator_type_date_time UNIQUE (type, date_time);
+
+-- 4. Narrow the key columns to the model's widths (type VARCHAR(64), region VARCHAR(16)).
+--    In strict mode MySQL rejects the change if any stored value is longer; check with
+--    SELECT MAX(CHAR_LENGTH(type)), MAX(CHAR_LENGTH(region)) FROM macro_indicator;
+ALTER TABLE macro_indicator
+    MODIFY type VARCHAR(64) NOT NULL,
+    MODIFY region VARCHAR(16) NOT NULL;
+
+-- 5. Index the region / date range lookups behind the dashboard endpoints
+ALTER TABLE macro_indicator
+    ADD INDEX ix_macro_indicator_region_date_time (region, date_time);
@@ -0,0 +1,16 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+
+@pytest.fixture
+def date_range():
+    """Fixed observation window used by tests that mock the data sources."""
+    return datetime(2024, 1, 1), datetime(2024, 1, 10)
+
+
+@pytest.fixture
+def recent_date_range():
+    """Last two weeks, for tests against live sources; always covers several trading days."""
+    end_date = datetime.now()
+    return end_date - timedelta(days=14), end_date
@@ -0,0 +1,29 @@
+import os
+
+import pytest
+
+from client.yahoo_finance_client import YahooFinanceClient
+
+# These tests call Yahoo Finance over the network; opt in with RUN_NETWORK_TESTS=1
+pytestmark = pytest.mark.skipif(
+    not os.getenv("RUN_NETWORK_TESTS"),
+    reason="set RUN_NETWORK_TESTS=1 to run tests against live Yahoo Finance"
+)
+
+
+@pytest.fixture
+def client():
+    return YahooFinanceClient()
+
+
+class TestYahooFinanceFetch:
+    """Hit Yahoo Finance for real, so a yfinance change that breaks the download shows up as a failure."""
+
+    def test_commodity_prices_are_all_available(self, client, recent_date_range):
+        # Act
+        prices = client.get_commodity_prices(*recent_date_range)
+
+        # Assert
+        assert set(prices) == set(YahooFinanceClient.SYMBOLS)
+        missing = [commodity for commodity, price in prices.items() if price is None]
+        assert not missing, f"Yahoo Finance returned no price for {missing}"
@@ -0,0 +1,154 @@
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.response import HTTPResponse
+
+from client.fred_macro_data_client import FredMacroDataClient, _RateLimitedAdapter, _RateLimiter
+
+
+def _ok_response(adapter, request, **kwargs):
+    """Stand-in for the network: a 200 JSON response to whatever request was sent."""
+    raw = HTTPResponse(
+        body=BytesIO(b'{"observations": []}'),
+        headers={"Content-Type": "application/json"},
+        status=200,
+        preload_content=False,
+        request_url=request.url
+    )
+    return adapter.build_response(request, raw)
+
+
+class TestRateLimitedAdapter:
+    @pytest.fixture
+    def rate_limiter(self, mocker):
+        return mocker.Mock()
+
+    @pytest.fixture
+    def session(self, mocker, rate_limiter):
+        mocker.patch.object(HTTPAdapter, "send", autospec=True, side_effect=_ok_response)
+        session = CachedSession(backend="memory", expire_after=60)
+        session.mount("https://", _RateLimitedAdapter(rate_limiter))
+        yield session
+        session.close()
+
+    def test_network_request_takes_a_rate_limit_slot(self, session, rate_limiter):
+        # Act
+        session.get("https://api.stlouisfed.org/fred/series/observations", params={"series_id": "DGS10"})
+
+        # Assert
+        rate_limiter.acquire.assert_called_once()
+
+    def test_cache_hit_does_not_take_a_rate_limit_slot(self, session, rate_limiter):
+        # Arrange
+        url = "https://api.stlouisfed.org/fred/series/observations"
+        session.get(url, params={"series_id": "DGS10"})
+
+        # Act
+        response = session.get(url, params={"series_id": "DGS10"})
+
+        # Assert
+        assert response.from_cache
+        rate_limiter.acquire.assert_called_once()
+
+
+class TestRateLimiter:
+    @pytest.fixture
+    def mock_time(self, mocker):
+        return mocker.patch("client.fred_macro_data_client.time")
+
+    def test_allows_max_calls_without_waiting(self, mock_time):
+        # Arrange
+        mock_time.monotonic.return_value = 0.0
+        limiter = _RateLimiter(max_calls=3, period=60)
+
+        # Act
+        for _ in range(3):
+            limiter.acquire()
+
+        # Assert
+        mock_time.sleep.assert_not_called()
+
+    def test_waits_until_the_oldest_call_leaves_the_window(self, mock_time):
+        # Arrange
+        mock_time.monotonic.side_effect = [0.0, 0.0, 10.0, 60.0]
+        limiter = _RateLimiter(max_calls=2, period=60)
+        limiter.acquire()
+        limiter.acquire()
+
+        # Act
+        limiter.acquire()
+
+        # Assert
+        mock_time.sleep.assert_called_once_with(50.0)
+
+    def test_expired_calls_free_their_slots(self, mock_time):
+        # Arrange
+        mock_time.monotonic.side_effect = [0.0, 0.0, 60.0, 60.0]
+        limiter = _RateLimiter(max_calls=2, period=60)
+        limiter.acquire()
+        limiter.acquire()
+
+        # Act
+        limiter.acquire()
+        limiter.acquire()
+
+        # Assert
+        mock_time.sleep.assert_not_called()
+
+
+class TestFredSeriesParsing:
+    @pytest.fixture
+    def client(self, monkeypatch, tmp_path):
+        # Keep the client's on-disk HTTP cache out of the project directory
+        monkeypatch.setattr("client.fred_macro_data_client.FRED_HTTP_CACHE_PATH", str(tmp_path / "macro_cache"))
+        client = FredMacroDataClient(api_key="test-key")
+        yield client
+        client.close()
+
+    @pytest.fixture
+    def observations(self):
+        # FRED marks missing values, e.g. market holidays, with '.'
+        return [
+            {"date": "2024-01-02", "value": "3.95"},
+            {"date": "2024-01-03", "value": "."},
+            {"date": "2024-01-04", "value": "3.99"}
+        ]
+
+    def test_missing_values_are_parsed_as_nan(self, mocker, client, date_range, observations):
+        # Arrange
+        mocker.patch.object(client, "_fetch_fred_observations", return_value=observations)
+
+        # Act
+        series = client._fetch_fred_series("DGS10", *date_range)
+
+        # Assert
+        assert list(series.index) == list(pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04"]))
+        assert series.iloc[0] == 3.95
+        assert np.isnan(series.iloc[1])
+        assert series.iloc[2] == 3.99
+
+    def test_missing_values_are_dropped_from_series_value(self, mocker, client, date_range, observations):
+        # Arrange
+        mocker.patch.object(client, "_fetch_fred_observations", return_value=observations)
+
+        # Act
+        series = client._get_fred_series_value("DGS10", *date_range)
+
+        # Assert
+        assert series.to_dict() == {pd.Timestamp("2024-01-02"): 3.95, pd.Timestamp("2024-01-04"): 3.99}
+
+    def test_series_value_is_none_when_every_value_is_missing(self, mocker, client, date_range):
+        # Arrange
+        mocker.patch.object(
+            client, "_fetch_fred_observations", return_value=[{"date": "2024-01-02", "value": "."}]
+        )
+
+        # Act
+        series = client._get_fred_series_value("DGS10", *date_range)
+
+        # Assert
+        assert series is None
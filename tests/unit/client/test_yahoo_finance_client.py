@@ -0,0 +1,96 @@
+import pandas as pd
+import pytest
+
+from client.yahoo_finance_client import YAHOO_PRICE_CACHE, YahooFinanceClient
+
+
+@pytest.fixture(autouse=True)
+def clear_price_cache():
+    YAHOO_PRICE_CACHE.clear()
+    yield
+    YAHOO_PRICE_CACHE.clear()
+
+
+@pytest.fixture
+def client():
+    return YahooFinanceClient()
+
+
+def _download_frame(closes):
+    """Build a frame shaped like yf.download output for several tickers: (Price, Ticker) columns."""
+    frame = pd.DataFrame(closes, index=pd.DatetimeIndex(["2024-01-02", "2024-01-03"]))
+    frame.columns = pd.MultiIndex.from_product([["Close"], frame.columns], names=["Price", "Ticker"])
+    return frame
+
+
+class TestGetCommodityPrices:
+    def test_returns_latest_close_per_commodity(self, mocker, client, date_range):
+        # Arrange
+        mock_download = mocker.patch("yfinance.download")
+        mock_download.return_value = _download_frame({"CL=F": [70.5, 71.5], "GC=F": [2050.0, float("nan")]})
+
+        # Act
+        prices = client.get_commodity_prices(*date_range)
+
+        # Assert
+        assert prices == {"crude_oil": 71.5, "gold": 2050.0}
+        assert "session" not in mock_download.call_args.kwargs
+
+    def test_returns_none_for_a_single_missing_commodity(self, mocker, client, date_range):
+        # Arrange
+        mock_download = mocker.patch("yfinance.download")
+        mock_download.return_value = _download_frame({"CL=F": [70.5, 71.5], "GC=F": [float("nan"), float("nan")]})
+
+        # Act
+        prices = client.get_commodity_prices(*date_range)
+
+        # Assert
+        assert prices == {"crude_oil": 71.5, "gold": None}
+
+    def test_raises_when_every_commodity_is_missing(self, mocker, client, date_range):
+        # Arrange
+        mocker.patch("yfinance.download", return_value=pd.DataFrame())
+
+        # Act / Assert
+        with pytest.raises(Exception, match="no prices returned"):
+            client.get_commodity_prices(*date_range)
+
+    def test_raises_when_download_fails(self, mocker, client, date_range):
+        # Arrange
+        mocker.patch("yfinance.download", side_effect=RuntimeError("session rejected"))
+
+        # Act / Assert
+        with pytest.raises(Exception, match="session rejected") as exc_info:
+            client.get_commodity_prices(*date_range)
+        # The yfinance error is chained so its traceback reaches fetch_all's per-group result
+        assert isinstance(exc_info.value.__cause__, RuntimeError)
+
+    def test_repeated_call_for_same_dates_is_served_from_cache(self, mocker, client, date_range):
+        # Arrange
+        mock_download = mocker.patch("yfinance.download")
+        mock_download.return_value = _download_frame({"CL=F": [70.5, 71.5], "GC=F": [2050.0, 2060.0]})
+        client.get_commodity_prices(*date_range)
+
+        # Act
+        prices = client.get_commodity_prices(*date_range)
+
+        # Assert
+        assert prices == {"crude_oil": 71.5, "gold": 2060.0}
+        mock_download.assert_called_once()
+
+    def test_total_failure_is_not_cached(self, mocker, client, date_range):
+        # Arrange
+        mock_download = mocker.patch("yfinance.download")
+        mock_download.side_effect = [
+            pd.DataFrame(),
+            _download_frame({"CL=F": [70.5, 71.5], "GC=F": [2050.0, 2060.0]})
+        ]
+        with pytest.raises(Exception, match="no prices returned"):
+            client.get_commodity_prices(*date_range)
+
+        # Act
+        prices = client.get_commodity_prices(*date_range)
+
+        # Assert
+        assert prices == {"crude_oil": 71.5, "gold": 2060.0}
+        assert mock_download.call_count == 2
@@ -0,0 +1,48 @@
+import logging
+
+import pytest
+
+from config.logging_config import setup_logging
+
+
+@pytest.fixture
+def root_logger():
+    """Restore the root and third-party logger state touched by setup_logging."""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    saved_propagate = {name: logging.getLogger(name).propagate for name in ['urllib3', 'requests']}
+    yield root
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
+    for name, propagate in saved_propagate.items():
+        logging.getLogger(name).propagate = propagate
+
+
+class TestSetupLogging:
+    def test_configures_an_unconfigured_root_logger(self, root_logger):
+        # Arrange
+        root_logger.handlers[:] = []
+
+        # Act
+        setup_logging(logging.DEBUG)
+
+        # Assert
+        assert root_logger.level == logging.DEBUG
+        assert len(root_logger.handlers) == 1
+        assert logging.getLogger('urllib3').propagate is False
+        assert logging.getLogger('requests').propagate is False
+
+    def test_reconfiguring_applies_level_and_third_party_settings_without_new_handler(self, root_logger):
+        # Arrange
+        root_logger.handlers[:] = [logging.NullHandler()]
+        logging.getLogger('urllib3').propagate = True
+        logging.getLogger('requests').propagate = True
+
+        # Act
+        setup_logging(logging.WARNING)
+
+        # Assert
+        assert root_logger.level == logging.WARNING
+        assert len(root_logger.handlers) == 1
+        assert logging.getLogger('urllib3').propagate is False
+        assert logging.getLogger('requests').propagate is False
@@ -0,0 +1,86 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects import mysql
+
+from repository.macro_indicator_repo import MacroIndicatorRepository, _upsert_statement
+
+
+@pytest.fixture
+def session(mocker):
+    return mocker.Mock()
+
+
+@pytest.fixture
+def repo(session):
+    return MacroIndicatorRepository(session=session)
+
+
+@pytest.fixture
+def rows():
+    return [
+        {
+            "type": "DGS10",
+            "name": "TREASURY_10Y_YIELD",
+            "value": 4.25,
+            "date_time": datetime(2024, 1, 2),
+            "is_leading_indicator": False,
+            "region": "US"
+        },
+        {
+            "type": "DGS10",
+            "name": "TREASURY_10Y_YIELD",
+            "value": 4.31,
+            "date_time": datetime(2024, 1, 3),
+            "is_leading_indicator": False,
+            "region": "US"
+        }
+    ]
+
+
+def _compiled_upsert() -> str:
+    return str(_upsert_statement().compile(dialect=mysql.dialect()))
+
+
+class TestBulkUpsert:
+    def test_empty_rows_do_not_touch_the_session(self, repo, session):
+        # Act
+        saved_count = repo.bulk_upsert([])
+
+        # Assert
+        assert saved_count == 0
+        session.execute.assert_not_called()
+        session.commit.assert_not_called()
+
+    def test_inserts_all_rows_in_one_statement(self, repo, session, rows):
+        # Act
+        saved_count = repo.bulk_upsert(rows)
+
+        # Assert
+        assert saved_count == 2
+        session.execute.assert_called_once_with(_upsert_statement(), rows)
+        session.commit.assert_called_once()
+        assert _compiled_upsert().startswith("INSERT INTO macro_indicator")
+
+    def test_existing_type_and_date_time_is_updated_in_place(self):
+        # Act
+        sql = _compiled_upsert()
+        update_clause = sql.split("ON DUPLICATE KEY UPDATE", 1)[1]
+
+        # Assert
+        # The unique (type, date_time) key identifies the record, everything else is replaced
+        assert "value = VALUES(value)" in update_clause
+        assert "name = VALUES(name)" in update_clause
+        assert "region = VALUES(region)" in update_clause
+        assert "type = " not in update_clause
+        assert "date_time = " not in update_clause
+
+    def test_rolls_back_and_reraises_on_error(self, repo, session, rows):
+        # Arrange
+        session.execute.side_effect = RuntimeError("connection lost")
+
+        # Act / Assert
+        with pytest.raises(RuntimeError, match="connection lost"):
+            repo.bulk_upsert(rows)
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
@@ -0,0 +1,154 @@
+import asyncio
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from service.macro_data_service import (
+    COMMODITY_MAP,
+    TREASURY_MAP,
+    MacroDataService,
+    _scalar_rows,
+    _series_rows,
+)
+
+
+class TestSeriesRows:
+    def test_builds_one_row_per_non_null_value(self):
+        # Arrange
+        series = pd.Series(
+            [3.95, float("nan"), 4],
+            index=pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04"])
+        )
+
+        # Act
+        rows = _series_rows(series, "DGS10", "TREASURY_10Y_YIELD")
+
+        # Assert
+        assert rows == [
+            {
+                "type": "DGS10",
+                "name": "TREASURY_10Y_YIELD",
+                "is_leading_indicator": False,
+                "region": "US",
+                "value": 3.95,
+                "date_time": pd.Timestamp("2024-01-02")
+            },
+            {
+                "type": "DGS10",
+                "name": "TREASURY_10Y_YIELD",
+                "is_leading_indicator": False,
+                "region": "US",
+                "value": 4.0,
+                "date_time": pd.Timestamp("2024-01-04")
+            }
+        ]
+        assert all(type(row["value"]) is float for row in rows)
+
+    def test_rows_do_not_share_state(self):
+        # Arrange
+        series = pd.Series([1.0, 2.0], index=pd.to_datetime(["2024-01-02", "2024-01-03"]))
+
+        # Act
+        rows = _series_rows(series, "GDP", "CHINA_GDP", True, "CHINA")
+        rows[0]["value"] = 99.0
+
+        # Assert
+        assert rows[1]["value"] == 2.0
+        assert rows[1]["is_leading_indicator"] is True
+        assert rows[1]["region"] == "CHINA"
+
+    def test_missing_series_yields_no_rows(self):
+        # Act
+        rows = _series_rows(None, "DGS10", "TREASURY_10Y_YIELD")
+
+        # Assert
+        assert rows == []
+
+
+class TestScalarRows:
+    def test_skips_unavailable_values(self):
+        # Arrange
+        date_time = datetime(2024, 1, 4)
+
+        # Act
+        rows = _scalar_rows({"crude_oil": 71, "gold": None}, COMMODITY_MAP, date_time)
+
+        # Assert
+        assert rows == [
+            {
+                "type": "CRUDE_OIL_FUT",
+                "name": "CRUDE_OIL_FUTURES",
+                "value": 71.0,
+                "date_time": date_time,
+                "is_leading_indicator": False,
+                "region": "US"
+            }
+        ]
+
+
+class TestFetchAll:
+    @pytest.fixture
+    def fred_client(self, mocker):
+        fred_client = mocker.Mock()
+        fred_client.get_leading_indicators.return_value = {"leading_index_us": None}
+        fred_client.get_consumer_indices.return_value = {}
+        fred_client.get_financial_condition_indices.return_value = {}
+        fred_client.get_treasury_yields_and_spreads.return_value = {
+            "dgs10": pd.Series([3.95], index=pd.to_datetime(["2024-01-02"]))
+        }
+        return fred_client
+
+    @pytest.fixture
+    def yahoo_finance_client(self, mocker):
+        yahoo_finance_client = mocker.Mock()
+        yahoo_finance_client.get_commodity_prices.side_effect = Exception("Yahoo Finance unavailable")
+        return yahoo_finance_client
+
+    @pytest.fixture
+    def service(self, mocker, fred_client, yahoo_finance_client):
+        akshare_client = mocker.patch("service.macro_data_service.AkshareFinanceClient").return_value
+        akshare_client.get_china_gdp_growth.return_value = {}
+        return MacroDataService(fred_client=fred_client, yahoo_finance_client=yahoo_finance_client)
+
+    @pytest.fixture(autouse=True)
+    def repository(self, mocker):
+        return mocker.patch("service.macro_data_service.MacroIndicatorRepository")
+
+    @pytest.fixture(autouse=True)
+    def db_session(self, mocker):
+        get_db_session = mocker.patch("service.macro_data_service.get_db_session")
+        return get_db_session.return_value.__enter__.return_value
+
+    def test_failed_group_is_reported_and_the_rest_are_stored(self, service, repository, db_session, date_range):
+        # Arrange
+        repository.return_value.bulk_upsert.return_value = 1
+
+        # Act
+        results = asyncio.run(service.fetch_all(*date_range))
+
+        # Assert
+        assert isinstance(results.pop("commodity_prices"), Exception)
+        assert results == {
+            "leading_indicators": True,
+            "treasury_data": True,
+            "consumer_indices": True,
+            "financial_condition_indices": True,
+            "china_gdp_data": True
+        }
+        # Rows are written through a repository bound to a get_db_session session
+        repository.assert_called_with(db_session)
+        stored_rows = repository.return_value.bulk_upsert.call_args.args[0]
+        assert [(row["type"], row["value"]) for row in stored_rows] == [(TREASURY_MAP["dgs10"][0], 3.95)]
+
+    def test_nothing_is_stored_when_no_group_returns_rows(self, service, fred_client, repository, date_range):
+        # Arrange
+        fred_client.get_treasury_yields_and_spreads.side_effect = Exception("FRED unavailable")
+
+        # Act
+        results = asyncio.run(service.fetch_all(*date_range))
+
+        # Assert
+        assert isinstance(results["treasury_data"], Exception)
+        assert isinstance(results["commodity_prices"], Exception)
+        repository.return_value.bulk_upsert.assert_not_called()